@@ -1,131 +1,306 @@
 import os
 import re
+import shutil
+import subprocess
+import tempfile
 import zipfile
+from collections import Counter
+from contextlib import closing
+from functools import lru_cache
 from datetime import datetime
 from urllib.parse import urljoin
 import requests
-from bs4 import BeautifulSoup
-import pyodbc
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from lxml import etree
+try:
+    import pyodbc
+except ImportError:  # mdbtools can be used instead of the Access ODBC driver
+    pyodbc = None
 import plotly.express as px
 import plotly.graph_objects as go
 import plotly.io as pio
 import pandas as pd
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 
 # Constants
 DOWNLOAD_DIR = r"C:\Users\JamieParker\Documents\ITU\IFICS\downloads"
 EXTRACT_DIR  = r"C:\Users\JamieParker\Documents\ITU\IFICS\databases"
 BASE_URL     = "https://www.itu.int/sns/wic/demowic{year}.html"
 VALID_VERSIONS = ("converted-to-v9.1", "converted-to-v10", "ific10")
+VALID_NTC_TYPES = {"G", "N", "S", "T", "R"}
+CHUNK_SIZE   = 1 << 20  # 1 MiB copy buffer for downloads and extraction
+DATE_RE      = re.compile(r"\b\d{2}\.\d{2}\.\d{4}\b")
+VERSION_RE   = re.compile("|".join(map(re.escape, VALID_VERSIONS)))
+CONN_TMPL    = r"Driver={{Microsoft Access Driver (*.mdb, *.accdb)}};DBQ={path};ReadOnly=1"
+
+ARIA2C       = shutil.which("aria2c")  # segmented downloader, used when installed
+MDB_EXPORT   = shutil.which("mdb-export")  # mdbtools, preferred over ODBC when installed
+NOTICE_COLS  = ["adm", "ntf_rsn", "ntc_type"]
+
+def _env_workers(name, default):
+    """Read a positive worker count from the environment, falling back to default."""
+    try:
+        return max(1, int(os.environ.get(name, default)))
+    except ValueError:
+        print(f"[Warning] Ignoring invalid {name}={os.environ[name]!r}, using {default}")
+        return default
+
+DL_WORKERS = _env_workers("IFIC_DL_CONCURRENCY", 16)
+
+# ODBC connection pooling avoids repeated JET engine start-up (must be set before connecting)
+if pyodbc:
+    pyodbc.pooling = True
+
+# Shared HTTP session so repeated itu.int requests reuse keep-alive connections
+SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=16, pool_maxsize=max(16, DL_WORKERS),
+                       max_retries=Retry(total=2, backoff_factor=0.3))
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
 
 def parse_date(date_str):
     return datetime.strptime(date_str, "%d.%m.%Y")
 
+def _parse_matched_date(date_str):
+    # DATE_RE already guarantees dd.mm.yyyy, so skip strptime's format handling
+    return datetime(int(date_str[6:10]), int(date_str[3:5]), int(date_str[0:2]))
+
 def fetch_page(url):
+    """Probe a page with a HEAD request; returns the response if it exists, else None."""
     try:
-        r = requests.get(url)
+        r = SESSION.head(url, allow_redirects=True, timeout=5)
         return r if r.status_code == 200 else None
     except Exception:
         return None
 
+def _parse_row(tr, url):
+    """Return the IFIC record for a table row, or None if it has no date or valid link."""
+    text = " ".join(t.strip() for t in tr.itertext() if t.strip())
+    m = DATE_RE.search(text)
+    if not m:
+        return None
+    try:
+        rec_date = _parse_matched_date(m.group(0))
+    except ValueError:
+        return None
+    valid_link = None
+    for a in tr.xpath(".//a[@href]"):
+        href = a.get("href")
+        if VERSION_RE.search(href):
+            valid_link = href
+            break
+    if not valid_link:
+        return None
+    full_link = valid_link if valid_link.startswith("http") else urljoin(url, valid_link)
+    return {"date": rec_date, "url": full_link}
+
+def _read_rows(parser, url):
+    """Yield records for the rows the pull parser has completed, freeing each row after use."""
+    for _, tr in parser.read_events():
+        rec = _parse_row(tr, url)
+        tr.clear()
+        if rec:
+            yield rec
+
+@lru_cache(maxsize=128)
+def _parse_year_page(year):
+    """Fetch and parse a year's IFIC page once; results are cached per year.
+
+    Failures raise instead of returning, so they are not cached and a later call retries.
+    """
+    url = BASE_URL.format(year=str(year)[-2:])
+    records = []
+    with SESSION.get(url, stream=True, timeout=10) as resp:
+        if resp.status_code != 200:
+            raise requests.HTTPError(f"Status {resp.status_code}", response=resp)
+        # Parse rows as they arrive instead of buffering the whole page first
+        parser = etree.HTMLPullParser(events=("end",), tag="tr")
+        for chunk in resp.iter_content(chunk_size=32768):
+            parser.feed(chunk)
+            records.extend(_read_rows(parser, url))
+        parser.close()
+        records.extend(_read_rows(parser, url))
+    return tuple(records)
+
 def get_ific_records_for_year(year):
-    year_suffix = str(year)[-2:]
-    url = BASE_URL.format(year=year_suffix)
-    resp = fetch_page(url)
-    if not resp:
-        print(f"[Warning] Page for {year} not found: {url}")
+    try:
+        records = _parse_year_page(year)
+    except (requests.RequestException, etree.ParseError):
+        # ParseError covers close() on an empty body, which lxml rejects
+        print(f"[Warning] Page for {year} not found: {BASE_URL.format(year=str(year)[-2:])}")
         return []
-    soup = BeautifulSoup(resp.text, 'html.parser')
-    records = []
-    for tr in soup.find_all("tr"):
-        text = tr.get_text(" ", strip=True)
-        m = re.search(r"\b\d{2}\.\d{2}\.\d{4}\b", text)
-        if not m:
-            continue
-        try:
-            rec_date = parse_date(m.group(0))
-        except Exception:
-            continue
-        valid_link = None
-        for a in tr.find_all("a", href=True):
-            if any(ver in a['href'] for ver in VALID_VERSIONS):
-                valid_link = a
-                break
-        if valid_link:
-            link = valid_link['href']
-            full_link = link if link.startswith("http") else urljoin(url, link)
-            records.append({"date": rec_date, "url": full_link})
-    return records
+    # Copy the cached records so callers can annotate them (e.g. zip_path)
+    return [dict(rec) for rec in records]
+
+def probe_years(years):
+    """Check which yearly IFIC pages exist, probing them concurrently."""
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        return list(executor.map(
+            lambda yr: (yr, fetch_page(BASE_URL.format(year=str(yr)[-2:]))),
+            years))
 
 def get_date_range_records(start_date, end_date):
     records = []
     for yr in range(start_date.year, end_date.year + 1):
-        year_suffix = str(yr)[-2:]
-        url = BASE_URL.format(year=year_suffix)
-        if not fetch_page(url):
-            print(f"[Warning] Page for {yr} not found: {url}")
-            continue
+        # get_ific_records_for_year warns about missing pages itself
         for rec in get_ific_records_for_year(yr):
             if start_date <= rec["date"] <= end_date:
                 records.append(rec)
     return records
 
+def expected_mdb_path(zip_path):
+    """Where the database from a downloaded IFIC ZIP is expected to be extracted."""
+    return os.path.join(EXTRACT_DIR, os.path.splitext(os.path.basename(zip_path))[0] + ".mdb")
+
+def remote_size(url):
+    """Return the server's Content-Length for url, or 0 if it is unknown."""
+    try:
+        h = SESSION.head(url, allow_redirects=True, timeout=5)
+        return int(h.headers.get("Content-Length", 0))
+    except Exception:
+        return 0
+
 def prompt_for_download(records):
     to_download = []
+    to_check = []
     os.makedirs(DOWNLOAD_DIR, exist_ok=True)
     for rec in records:
         zip_name = os.path.basename(rec["url"])
         zip_path = os.path.join(DOWNLOAD_DIR, zip_name)
         rec["zip_path"] = zip_path
-        if not os.path.exists(zip_path):
+        if os.path.exists(expected_mdb_path(zip_path)):
+            continue
+        if os.path.exists(zip_path + ".aria2"):
+            # aria2c's control file is still there, so its download never finished
+            to_download.append(rec)
+        elif os.path.exists(zip_path):
+            to_check.append(rec)
+        else:
             to_download.append(rec)
+    # Compare existing ZIPs against the server size to catch partial downloads
+    if to_check:
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            sizes = list(executor.map(lambda rec: remote_size(rec["url"]), to_check))
+        for rec, size in zip(to_check, sizes):
+            rec["size"] = size
+            if size and os.path.getsize(rec["zip_path"]) != size:
+                to_download.append(rec)
     return to_download
 
-def download_file(rec):
-    """Download a single ZIP file with a larger chunk size for efficiency."""
+def download_file(rec, session=SESSION):
+    """Download a single ZIP file, resuming a partial download where possible."""
     zip_path = rec["zip_path"]
     url = rec["url"]
+    size = rec.get("size", 0)
 
-    if os.path.exists(zip_path):
+    control_path = zip_path + ".aria2"
+    # An unfinished aria2c file holds segments out of order, so it can't be resumed here
+    unfinished = os.path.exists(control_path)
+    have = os.path.getsize(zip_path) if os.path.exists(zip_path) and not unfinished else 0
+    if have and not size:
+        # Only trust an existing file once its size has been checked against the server
+        size = rec["size"] = remote_size(url)
+    if have and (not size or have == size):
         print(f"[Info] Already downloaded: {zip_path}")
         return
 
     print(f"[Downloading] {url} -> {zip_path}")
+    headers = {"Range": f"bytes={have}-"} if 0 < have < size else {}
     try:
-        session = requests.Session()
-        with session.get(url, stream=True, timeout=10) as r:
-            if r.status_code == 200:
-                with open(zip_path, "wb") as f:
-                    for chunk in r.iter_content(chunk_size=65536):
-                        f.write(chunk)
+        with session.get(url, stream=True, timeout=10, headers=headers) as r:
+            if r.status_code in (200, 206):
+                # A 200 means the server ignored the Range header, so start over
+                mode = "ab" if r.status_code == 206 else "wb"
+                # Copy the raw stream in 1 MiB blocks, skipping the per-chunk Python loop
+                r.raw.decode_content = True
+                with open(zip_path, mode, buffering=CHUNK_SIZE) as f:
+                    shutil.copyfileobj(r.raw, f, length=CHUNK_SIZE)
+                if unfinished:
+                    os.remove(control_path)
                 print(f"[Success] Downloaded: {zip_path}")
             else:
                 print(f"[Error] Failed: {url} (Status {r.status_code})")
     except Exception as e:
         print(f"[Error] Downloading {url}: {e}")
 
-def download_files_parallel(files, max_workers=5):
-    """Download multiple files concurrently using ThreadPoolExecutor."""
+def download_files_aria2(files, max_workers=DL_WORKERS):
+    """Download files with aria2c using segmented parallel GETs; returns True on success."""
+    # Each URL is followed by an indented out= option so files land at rec["zip_path"]
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as f:
+        for rec in files:
+            f.write(f"{rec['url']}\n  out={os.path.basename(rec['zip_path'])}\n")
+        urls_file = f.name
+    try:
+        # Split the connection budget into up to 4 connections per file, e.g. 16 = 4 files x 4
+        per_file = min(4, max_workers)
+        jobs = max(1, max_workers // per_file)
+        # No preallocation, so an interrupted file stays short and fails the size check
+        result = subprocess.run([ARIA2C, "-x", str(per_file), "-s", str(per_file), "-j", str(jobs),
+                                 "-i", urls_file, "-d", DOWNLOAD_DIR,
+                                 "--auto-file-renaming=false", "--continue=true",
+                                 "--file-allocation=none"])
+    finally:
+        os.remove(urls_file)
+    if result.returncode:
+        print(f"[Error] aria2c exited with status {result.returncode}, falling back to Python downloads")
+        for rec in files:
+            # A leftover .aria2 control file marks an unfinished, non-contiguous file
+            control_path = rec["zip_path"] + ".aria2"
+            if os.path.exists(control_path):
+                for path in (rec["zip_path"], control_path):
+                    if os.path.exists(path):
+                        os.remove(path)
+        return False
+    return True
+
+def download_files_parallel(files, max_workers=DL_WORKERS, session=SESSION):
+    """Download multiple files concurrently, via aria2c if installed, else a ThreadPoolExecutor."""
+    if ARIA2C and download_files_aria2(files, max_workers):
+        return
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        executor.map(download_file, files)
+        futures = [executor.submit(download_file, rec, session) for rec in files]
+        for future in as_completed(futures):
+            future.result()
+
+def _extract_one(rec):
+    """Extract the .mdb files from one downloaded ZIP (runs in a worker process)."""
+    if os.path.exists(expected_mdb_path(rec["zip_path"])):
+        print(f"[Info] {os.path.basename(expected_mdb_path(rec['zip_path']))} already extracted, skipping.")
+        return
+    try:
+        with zipfile.ZipFile(rec["zip_path"], 'r') as z:
+            mdb_files = [f for f in z.namelist() if f.lower().endswith('.mdb')]
+            if not mdb_files:
+                print(f"[Warning] No .mdb file in {os.path.basename(rec['zip_path'])}")
+            for file in mdb_files:
+                target_path = os.path.join(EXTRACT_DIR, os.path.basename(file))
+                if os.path.exists(target_path):
+                    print(f"[Info] {os.path.basename(file)} already extracted, skipping.")
+                    continue
+                # Stream into a uniquely named temp file and rename, so an interrupted extract
+                # never leaves a corrupt MDB and workers extracting the same name don't collide
+                fd, part_path = tempfile.mkstemp(suffix=".part", dir=EXTRACT_DIR)
+                try:
+                    with os.fdopen(fd, "wb") as dst, z.open(file) as src:
+                        shutil.copyfileobj(src, dst, length=CHUNK_SIZE)
+                    os.replace(part_path, target_path)
+                except BaseException:
+                    if os.path.exists(part_path):
+                        os.remove(part_path)
+                    raise
+                print(f"Extracted {file} from {os.path.basename(rec['zip_path'])}")
+    except Exception as e:
+        print(f"[Error] Extracting {os.path.basename(rec['zip_path'])}: {e}")
 
 def extract_zip_files(records):
+    """Decompress ZIPs in parallel across CPU cores."""
     os.makedirs(EXTRACT_DIR, exist_ok=True)
-    for rec in records:
-        try:
-            with zipfile.ZipFile(rec["zip_path"], 'r') as z:
-                mdb_files = [f for f in z.namelist() if f.lower().endswith('.mdb')]
-                if not mdb_files:
-                    print(f"[Warning] No .mdb file in {os.path.basename(rec['zip_path'])}")
-                for file in mdb_files:
-                    target_path = os.path.join(EXTRACT_DIR, os.path.basename(file))
-                    if os.path.exists(target_path):
-                        print(f"[Info] {os.path.basename(file)} already extracted, skipping.")
-                        continue
-                    z.extract(file, EXTRACT_DIR)
-                    print(f"Extracted {file} from {os.path.basename(rec['zip_path'])}")
-        except Exception as e:
-            print(f"[Error] Extracting {os.path.basename(rec['zip_path'])}: {e}")
+    if not records:
+        return
+    # Each spawned worker re-imports this module, so don't start more than there are ZIPs
+    with ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, len(records))) as executor:
+        list(executor.map(_extract_one, records))
 
 def select_date(prompt_text, default):
     s = input(f"{prompt_text} (default {default}): ").strip()
@@ -133,8 +308,7 @@ def select_date(prompt_text, default):
 
 def interactive_date_input():
     current_year = datetime.now().year
-    available = [yr for yr in range(1998, current_year + 2)
-                 if fetch_page(BASE_URL.format(year=str(yr)[-2:]))]
+    available = [yr for yr, resp in probe_years(range(1998, current_year + 2)) if resp]
     print("Available years:", available)
     start_str = select_date("Enter start date (dd.mm.yyyy)", "01.01.2024")
     end_str   = select_date("Enter end date (dd.mm.yyyy)", "01.01.2026")
@@ -149,37 +323,97 @@ def interactive_date_input():
         exit(1)
     return start_date, end_date
 
+def grouped_counts(cursor, expr):
+    """Count notice rows grouped by a column expression; NULL/blank keys become "Unknown"."""
+    cursor.execute(f"SELECT {expr}, COUNT(*) FROM notice GROUP BY {expr}")
+    counts = Counter()
+    for key, count in cursor:
+        counts[key or "Unknown"] += count
+    return counts
+
+def _count_with_odbc(mdb_path):
+    conn = pyodbc.connect(CONN_TMPL.format(path=mdb_path), autocommit=True, readonly=True)
+    # closing() releases the cursor and connection even if a query fails
+    with closing(conn), closing(conn.cursor()) as cursor:
+        cursor.arraysize = 10000
+        # Let the Access engine do the counting instead of shipping every row. Jet's GROUP BY on
+        # text is case-insensitive and TRIM only removes spaces, so keys are upper-cased here and
+        # column_counts normalises the mdbtools path the same way to keep both backends in step.
+        admin = grouped_counts(cursor, "UCASE(TRIM(adm))")
+        ntf_rsn = grouped_counts(cursor, "UCASE(TRIM(ntf_rsn))")
+        ntc_type = grouped_counts(cursor, "UCASE(TRIM(ntc_type))")
+    ntc_type = Counter({k: v for k, v in ntc_type.items() if k in VALID_NTC_TYPES})
+    return admin, ntf_rsn, ntc_type
+
+def column_counts(col, valid=None):
+    """Count a notice column the way Jet's UCASE(TRIM(...)) GROUP BY does; blanks become "Unknown".
+
+    If valid is given, only those values are counted.
+    """
+    # Count on the categorical codes first, then normalise only the small set of distinct keys
+    counts = col.value_counts()
+    keys = counts.index.astype(str).str.strip(" ").str.upper()
+    counts.index = keys.where(keys != "", "Unknown")
+    if valid is not None:
+        counts = counts[counts.index.isin(valid)]
+    counts = counts.groupby(level=0).sum()
+    return Counter({key: int(count) for key, count in counts.items() if count})
+
+def _count_with_mdbtools(mdb_path):
+    # Stream the notice table out as TSV, bypassing the JET engine and ODBC entirely
+    with subprocess.Popen([MDB_EXPORT, "-d", "\t", mdb_path, "notice"],
+                          stdout=subprocess.PIPE) as proc:
+        df = pd.read_csv(proc.stdout, sep="\t", usecols=NOTICE_COLS, dtype="category",
+                         keep_default_na=False)
+    if proc.returncode:
+        raise RuntimeError(f"mdb-export exited with status {proc.returncode}")
+    return (column_counts(df["adm"]),
+            column_counts(df["ntf_rsn"]),
+            column_counts(df["ntc_type"], valid=VALID_NTC_TYPES))
+
+def _count_one(mdb_path):
+    """Aggregate notice counts for a single .mdb; returns (admin, ntf_rsn, ntc_type, total)."""
+    try:
+        if MDB_EXPORT:
+            admin, ntf_rsn, ntc_type = _count_with_mdbtools(mdb_path)
+        else:
+            admin, ntf_rsn, ntc_type = _count_with_odbc(mdb_path)
+    except Exception as e:
+        print(f"[Error] Processing {mdb_path}: {e}")
+        return Counter(), Counter(), Counter(), 0
+    return admin, ntf_rsn, ntc_type, sum(admin.values())
+
 def query_databases():
-    admin_counts = {}
-    ntf_rsn_counts = {}
-    ntc_type_counts = {}
+    if not MDB_EXPORT and pyodbc is None:
+        print("[Error] Cannot read .mdb files: install mdbtools (mdb-export) "
+              "or pyodbc with the Microsoft Access ODBC driver.")
+        return
+    admin_counts = Counter()
+    ntf_rsn_counts = Counter()
+    ntc_type_counts = Counter()
     total_notices = 0
-    valid_ntc_types = {"G", "N", "S", "T", "R"}
-
-    for file in os.listdir(EXTRACT_DIR):
-        if file.lower().endswith('.mdb'):
-            mdb_path = os.path.join(EXTRACT_DIR, file)
-            try:
-                conn_str = r"Driver={Microsoft Access Driver (*.mdb, *.accdb)};DBQ=" + mdb_path
-                conn = pyodbc.connect(conn_str)
-                cursor = conn.cursor()
-                cursor.execute("SELECT adm, ntf_rsn, ntc_type FROM notice")
-                for row in cursor.fetchall():
-                    total_notices += 1
-                    adm = row.adm.strip() if row.adm else "Unknown"
-                    ntf_rsn = row.ntf_rsn.strip() if row.ntf_rsn else "Unknown"
-                    ntc_type = row.ntc_type.strip().upper() if row.ntc_type else "Unknown"
-                    admin_counts[adm] = admin_counts.get(adm, 0) + 1
-                    ntf_rsn_counts[ntf_rsn] = ntf_rsn_counts.get(ntf_rsn, 0) + 1
-                    if ntc_type in valid_ntc_types:
-                        ntc_type_counts[ntc_type] = ntc_type_counts.get(ntc_type, 0) + 1
-                conn.close()
-            except Exception as e:
-                print(f"[Error] Processing {mdb_path}: {e}")
+
+    with os.scandir(EXTRACT_DIR) as entries:
+        paths = [entry.path for entry in entries
+                 if entry.is_file() and entry.name.lower().endswith('.mdb')]
+    if paths:
+        # pyodbc releases the GIL during ODBC calls, so databases can be queried concurrently
+        with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+            for admin, ntf_rsn, ntc_type, total in executor.map(_count_one, paths):
+                admin_counts += admin
+                ntf_rsn_counts += ntf_rsn
+                ntc_type_counts += ntc_type
+                total_notices += total
+
+    admin_counts = dict(admin_counts)
+    ntf_rsn_counts = dict(ntf_rsn_counts)
+    ntc_type_counts = dict(ntc_type_counts)
 
     # Administration Horizontal Bar Chart (sorted descending)
-    sorted_admin = sorted(admin_counts.items(), key=lambda x: x[1], reverse=True)
-    df_admin = pd.DataFrame(sorted_admin, columns=["Administration", "Count"])
+    df_admin = (pd.Series(admin_counts, dtype="int64")
+                .sort_values(ascending=False)
+                .rename_axis("Administration")
+                .reset_index(name="Count"))
     fig_admin = px.bar(df_admin, x="Count", y="Administration", orientation="h",
                        title="Notice Counts per Administration",
                        text="Count")
@@ -197,8 +431,12 @@ def query_databases():
         "P": "AP30B-Articles 6 & 7",
         "U": "Res49"
     }
-    df_ntf = pd.DataFrame(list(ntf_rsn_counts.items()), columns=["Reason", "Count"])
+    # Map codes to labels and drop unrecognised reasons in one vectorised pass
+    df_ntf = (pd.Series(ntf_rsn_counts, dtype="int64")
+              .rename_axis("Reason")
+              .reset_index(name="Count"))
     df_ntf["Reason"] = df_ntf["Reason"].map(ntf_rsn_mapping)
+    df_ntf = df_ntf.dropna(subset=["Reason"])
     df_ntf["Percentage"] = df_ntf["Count"] / df_ntf["Count"].sum() * 100
     fig_ntf = px.pie(df_ntf, names="Reason", values="Percentage",
                      title="Notification Reasons Distribution (ntf_rsn)",
@@ -215,7 +453,7 @@ def query_databases():
         "T": "Typical Earth station"
     }
     df_ntc = pd.DataFrame([
-        {"Type": key, "Count": ntc_type_counts.get(key, 0)} for key in sorted(valid_ntc_types)
+        {"Type": key, "Count": ntc_type_counts.get(key, 0)} for key in sorted(VALID_NTC_TYPES)
     ])
     df_ntc["Type"] = df_ntc["Type"].map(ntc_type_mapping)
     df_ntc["Percentage"] = df_ntc["Count"] / total_notices * 100 if total_notices else 0
@@ -248,7 +486,7 @@ def main():
             print("Aborted by user.")
             return
         # Use concurrent downloads to speed up the process
-        download_files_parallel(to_download, max_workers=5)
+        download_files_parallel(to_download)
     else:
         print("\nAll files already downloaded.")
 